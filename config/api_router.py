@@ -1,9 +1,8 @@
-from django.conf import settings
-from rest_framework.routers import DefaultRouter, SimpleRouter
+from rest_framework.routers import SimpleRouter
 
 from cosray_backend.users.api.views import UserViewSet
 
-router = DefaultRouter() if settings.DEBUG else SimpleRouter()
+router = SimpleRouter()
 
 router.register("users", UserViewSet)
 
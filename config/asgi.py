@@ -13,6 +13,7 @@ import sys
 from pathlib import Path
 
 from django.core.asgi import get_asgi_application
+from django.urls import get_resolver
 
 # This allows easy placement of apps within the interior
 # cosray_backend directory.
@@ -25,6 +26,10 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.local")
 # This application object is used by any ASGI server configured to use this file.
 django_application = get_asgi_application()
 
+# Import the URLconf and populate the resolver while the worker boots, so the
+# first request it serves does not pay for it.
+get_resolver().reverse_dict  # noqa: B018
+
 # Import websocket application here, so apps from django_application are loaded first
 from config.websocket import websocket_application  # noqa: E402
 
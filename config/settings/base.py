@@ -1,13 +1,17 @@
 # noqa: ERA001, E501
 """Base settings to build other settings files upon."""
 
+import os
+import re
 import ssl
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, cast
 
 import environ
 
-BASE_DIR = Path(__file__).resolve(strict=True).parent.parent.parent
+# Plain string operations: no stat() calls or intermediate Path objects at import time.
+BASE_DIR = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 # cosray_backend/
 APPS_DIR = BASE_DIR / "cosray_backend"
 env = environ.Env()
@@ -28,19 +32,11 @@ DEBUG = env.bool("DJANGO_DEBUG", False)
 TIME_ZONE = "Asia/Shanghai"
 # https://docs.djangoproject.com/en/dev/ref/settings/#language-code
 LANGUAGE_CODE = "en-us"
-# https://docs.djangoproject.com/en/dev/ref/settings/#languages
-# from django.utils.translation import gettext_lazy as _
-# LANGUAGES = [
-#     ('en', _('English')),
-#     ('fr-fr', _('French')),
-#     ('pt-br', _('Portuguese')),
-# ]
 # https://docs.djangoproject.com/en/dev/ref/settings/#use-i18n
-USE_I18N = True
+# JSON-only API: responses are not localised, so skip per-request language activation.
+USE_I18N = False
 # https://docs.djangoproject.com/en/dev/ref/settings/#use-tz
 USE_TZ = True
-# https://docs.djangoproject.com/en/dev/ref/settings/#locale-paths
-LOCALE_PATHS = [str(BASE_DIR / "locale")]
 
 # DATABASES
 # ------------------------------------------------------------------------------
@@ -51,6 +47,9 @@ DATABASES = {
         default=f"sqlite:///{BASE_DIR / 'db.sqlite3'!s}",
     ),
 }
+# Requests are wrapped in a transaction so multi-row writes (e.g. the allauth headless
+# signup creating a User and its EmailAddress before sending mail) roll back on failure.
+# Views that never write opt out with transaction.non_atomic_requests (see config.urls).
 DATABASES["default"]["ATOMIC_REQUESTS"] = True
 # https://docs.djangoproject.com/en/stable/ref/settings/#std:setting-DEFAULT_AUTO_FIELD
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
@@ -64,14 +63,13 @@ WSGI_APPLICATION = "config.wsgi.application"
 
 # APPS
 # ------------------------------------------------------------------------------
-DJANGO_APPS = [
+DJANGO_APPS: tuple[str, ...] = (
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
-    "django.contrib.staticfiles",
     "django.forms",
-]
-THIRD_PARTY_APPS = [
+)
+THIRD_PARTY_APPS: tuple[str, ...] = (
     "allauth",
     "allauth.account",
     "allauth.mfa",
@@ -81,14 +79,14 @@ THIRD_PARTY_APPS = [
     "rest_framework.authtoken",
     "corsheaders",
     "drf_spectacular",
-]
+)
 
-LOCAL_APPS = [
+LOCAL_APPS: tuple[str, ...] = (
     "cosray_backend.users",
     # Your stuff: custom apps go here
-]
+)
 # https://docs.djangoproject.com/en/dev/ref/settings/#installed-apps
-INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
+INSTALLED_APPS: tuple[str, ...] = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 
 # MIGRATIONS
 # ------------------------------------------------------------------------------
@@ -96,10 +94,10 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # AUTHENTICATION
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#authentication-backends
-AUTHENTICATION_BACKENDS = [
+AUTHENTICATION_BACKENDS: tuple[str, ...] = (
     "django.contrib.auth.backends.ModelBackend",
     "allauth.account.auth_backends.AuthenticationBackend",
-]
+)
 # https://docs.djangoproject.com/en/dev/ref/settings/#auth-user-model
 AUTH_USER_MODEL = "users.User"
 # https://docs.djangoproject.com/en/dev/ref/settings/#login-redirect-url
@@ -110,52 +108,45 @@ LOGIN_URL = "api-root"
 # PASSWORDS
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
-PASSWORD_HASHERS = [
+PASSWORD_HASHERS: tuple[str, ...] = (
     # https://docs.djangoproject.com/en/dev/topics/auth/passwords/#using-argon2-with-django
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "cosray_backend.users.hashers.Argon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
-]
+)
+# Argon2 cost parameters used by cosray_backend.users.hashers.Argon2PasswordHasher.
+# Defaults follow the OWASP minimum for Argon2id (19 MiB, 2 iterations, 1 lane);
+# Django's own defaults (100 MiB, 8 lanes) make every login far more CPU/memory heavy.
+# Lowering these downgrades stored hashes: each one is re-hashed with the cheaper
+# parameters on the user's next login.
+# https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html#argon2id
+ARGON2_TIME_COST = env.int("DJANGO_ARGON2_TIME_COST", default=2)
+ARGON2_MEMORY_COST = env.int("DJANGO_ARGON2_MEMORY_COST", default=19456)
+ARGON2_PARALLELISM = env.int("DJANGO_ARGON2_PARALLELISM", default=1)
 # https://docs.djangoproject.com/en/dev/ref/settings/#auth-password-validators
-AUTH_PASSWORD_VALIDATORS = [
+AUTH_PASSWORD_VALIDATORS: tuple[dict[str, str], ...] = (
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
     },
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator"},
     {"NAME": "django.contrib.auth.password_validation.CommonPasswordValidator"},
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
-]
+)
 
 # MIDDLEWARE
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#middleware
-MIDDLEWARE = [
+MIDDLEWARE: tuple[str, ...] = (
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
-    "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "allauth.account.middleware.AccountMiddleware",
-]
-
-# STATIC
-# ------------------------------------------------------------------------------
-# https://docs.djangoproject.com/en/dev/ref/settings/#static-root
-# Backend remains responsible only for exposing API endpoints; no compiled frontend assets are bundled.
-STATIC_ROOT = str(BASE_DIR / "staticfiles")
-# https://docs.djangoproject.com/en/dev/ref/settings/#static-url
-STATIC_URL = "/static/"
-# No additional static asset search paths – frontend assets live in a separate project.
-STATICFILES_DIRS: tuple[str, ...] = ()
-# https://docs.djangoproject.com/en/dev/ref/contrib/staticfiles/#staticfiles-finders
-STATICFILES_FINDERS = [
-    "django.contrib.staticfiles.finders.FileSystemFinder",
-    "django.contrib.staticfiles.finders.AppDirectoriesFinder",
-]
+)
 
 # MEDIA
 # ------------------------------------------------------------------------------
@@ -242,8 +233,9 @@ HEADLESS_ONLY = True
 HEADLESS_CLIENTS = ("app",)
 # HEADLESS_FRONTEND_URLS can be supplied via environment-specific settings to point
 # password reset and email confirmation flows to the mobile client. Leaving the
-# default empty mapping keeps the backend from emitting broken links.
-HEADLESS_FRONTEND_URLS = {}
+# default empty mapping keeps the backend from emitting broken links. The read-only
+# proxy guards the shared default against in-place mutation.
+HEADLESS_FRONTEND_URLS: MappingProxyType[str, str] = MappingProxyType({})
 HEADLESS_SERVE_SPECIFICATION = env.bool("HEADLESS_SERVE_SPECIFICATION", default=False)
 
 # django-rest-framework
@@ -261,7 +253,8 @@ REST_FRAMEWORK = {
 }
 
 # django-cors-headers - https://github.com/adamchainz/django-cors-headers#setup
-CORS_URLS_REGEX = r"^/api/.*$"
+# Compiled once here so the middleware does not go through the re module cache per request.
+CORS_URLS_REGEX = re.compile(r"^/api/.*$")
 CORS_ALLOW_ALL_ORIGINS = env.bool("CORS_ALLOW_ALL_ORIGINS", default=False)
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
 CORS_ALLOW_CREDENTIALS = env.bool("CORS_ALLOW_CREDENTIALS", default=True)
@@ -10,7 +10,8 @@ SECRET_KEY = env(
     default="eluP5ZXzB3txkA2HanPOCO0nk6BGyR48ARvl341FGRGYtdUiBT1XRh4pJyQVK6NR",
 )
 # https://docs.djangoproject.com/en/dev/ref/settings/#allowed-hosts
-ALLOWED_HOSTS = ["localhost", "0.0.0.0", "127.0.0.1"]  # noqa: S104
+# 10.0.2.2 is how the Android emulator reaches the host machine.
+ALLOWED_HOSTS = ["localhost", "0.0.0.0", "127.0.0.1", "10.0.2.2"]  # noqa: S104
 
 # CACHES
 # ------------------------------------------------------------------------------
@@ -37,7 +38,7 @@ USE_DOCKER = env.bool("USE_DOCKER", default=False)
 # django-extensions
 # ------------------------------------------------------------------------------
 # https://django-extensions.readthedocs.io/en/latest/installation_instructions.html#configuration
-INSTALLED_APPS += ["django_extensions"]
+INSTALLED_APPS += ("django_extensions",)
 
 # API-only local development usually serves a separate frontend (Next.js, Vite, etc.).
 # Allow all origins locally to avoid extra environment tweaks and trust common dev hosts for CSRF.
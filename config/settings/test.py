@@ -17,7 +17,7 @@ TEST_RUNNER = "django.test.runner.DiscoverRunner"
 # PASSWORDS
 # ------------------------------------------------------------------------------
 # https://docs.djangoproject.com/en/dev/ref/settings/#password-hashers
-PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+PASSWORD_HASHERS = ("django.contrib.auth.hashers.MD5PasswordHasher",)
 
 # EMAIL
 # ------------------------------------------------------------------------------
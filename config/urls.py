@@ -1,24 +1,34 @@
+import json
+from functools import lru_cache
+
 from django.conf import settings
-from django.http import HttpRequest, JsonResponse
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
 from django.urls import include, path
 from django.views import defaults as default_views
 from drf_spectacular.views import SpectacularAPIView
 from rest_framework.authtoken.views import obtain_auth_token
 
 
-def api_root(request: HttpRequest) -> JsonResponse:
-    """Lightweight entry point for mobile clients."""
-
-    base_url = request.build_absolute_uri("/")
-    schema_url = request.build_absolute_uri("/api/schema/")
-    return JsonResponse(
+@lru_cache(maxsize=8)
+def _api_root_payload(origin: str) -> bytes:
+    return json.dumps(
         {
             "service": "CosRay-Backend API",
             "status": "ok",
-            "base_url": base_url.rstrip("/"),
-            "schema_url": schema_url,
+            "base_url": origin,
+            "schema_url": f"{origin}/api/schema/",
         }
-    )
+    ).encode()
+
+
+@transaction.non_atomic_requests
+def api_root(request: HttpRequest) -> HttpResponse:
+    """Lightweight entry point for mobile clients."""
+
+    # The body only depends on the origin, so it is serialized once per scheme/host pair.
+    origin = f"{request.scheme}://{request.get_host()}"
+    return HttpResponse(_api_root_payload(origin), content_type="application/json")
 
 
 urlpatterns = [
@@ -34,7 +44,11 @@ urlpatterns += [
     path("api/", include("config.api_router")),
     # DRF auth token
     path("api/auth-token/", obtain_auth_token, name="obtain_auth_token"),
-    path("api/schema/", SpectacularAPIView.as_view(), name="api-schema"),
+    path(
+        "api/schema/",
+        transaction.non_atomic_requests(SpectacularAPIView.as_view()),
+        name="api-schema",
+    ),
 ]
 
 if settings.DEBUG:
@@ -1,4 +0,0 @@
-/*
- * Legacy placeholder kept so collectstatic does not break existing pipelines.
- * All interactive behaviour now belongs to the decoupled frontend codebase.
- */
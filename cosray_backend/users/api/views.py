@@ -1,5 +1,6 @@
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
@@ -15,8 +16,11 @@ class UserViewSet(RetrieveModelMixin, ListModelMixin, UpdateModelMixin, GenericV
     lookup_field = "username"
 
     def get_queryset(self, *args, **kwargs):
-        assert isinstance(self.request.user.id, int)
-        return self.queryset.filter(id=self.request.user.id)
+        user_id = self.request.user.pk
+        if user_id is None:
+            raise PermissionDenied
+        # Only the columns UserSerializer exposes (plus the primary key) are loaded.
+        return self.queryset.filter(id=user_id).only("id", "username", "name")
 
     @action(detail=False)
     def me(self, request):
@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2 hasher whose cost parameters come from settings.
+
+    The algorithm name is unchanged, so existing hashes keep verifying. Django
+    re-hashes any hash whose parameters differ from the configured ones on the
+    user's next login. With the default settings this is a deliberate downgrade:
+    hashes made with Django's stock parameters (100 MiB, 8 lanes) are rewritten
+    with the cheaper OWASP-minimum ones, so every login stops paying the old cost.
+    """
+
+    def __init__(self) -> None:
+        self.time_cost = settings.ARGON2_TIME_COST
+        self.memory_cost = settings.ARGON2_MEMORY_COST
+        self.parallelism = settings.ARGON2_PARALLELISM
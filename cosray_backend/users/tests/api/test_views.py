@@ -1,4 +1,6 @@
 import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.test import APIRequestFactory
 
 from cosray_backend.users.api.views import UserViewSet
@@ -19,6 +21,16 @@ class TestUserViewSet:
 
         assert user in view.get_queryset()
 
+    def test_get_queryset_anonymous(self, api_rf: APIRequestFactory):
+        view = UserViewSet()
+        request = api_rf.get("/fake-url/")
+        request.user = AnonymousUser()
+
+        view.request = request
+
+        with pytest.raises(PermissionDenied):
+            view.get_queryset()
+
     def test_me(self, user: User, api_rf: APIRequestFactory):
         view = UserViewSet()
         request = api_rf.get("/fake-url/")
@@ -0,0 +1,28 @@
+from django.contrib.auth import hashers
+
+from cosray_backend.users.hashers import Argon2PasswordHasher
+
+
+def test_argon2_hasher_uses_configured_parameters(settings):
+    settings.ARGON2_TIME_COST = 3
+    settings.ARGON2_MEMORY_COST = 1024
+    settings.ARGON2_PARALLELISM = 2
+    hasher = Argon2PasswordHasher()
+
+    encoded = hasher.encode("s3cret-password", hasher.salt())
+
+    assert hasher.verify("s3cret-password", encoded)
+    decoded = hasher.decode(encoded)
+    assert (decoded["time_cost"], decoded["memory_cost"], decoded["parallelism"]) == (3, 1024, 2)
+    assert not hasher.must_update(encoded)
+
+
+def test_argon2_hasher_rehashes_stock_django_hashes(settings):
+    settings.ARGON2_TIME_COST = 2
+    settings.ARGON2_MEMORY_COST = 19456
+    settings.ARGON2_PARALLELISM = 1
+    stock = hashers.Argon2PasswordHasher()
+    encoded = stock.encode("s3cret-password", stock.salt())
+
+    # Stronger stock hashes are downgraded to the configured parameters on next login.
+    assert Argon2PasswordHasher().must_update(encoded)
@@ -0,0 +1,17 @@
+import json
+
+from config.urls import api_root
+
+
+def test_api_root(rf):
+    response = api_root(rf.get("/"))
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(response.content) == {
+        "service": "CosRay-Backend API",
+        "status": "ok",
+        "base_url": "http://testserver",
+        "schema_url": "http://testserver/api/schema/",
+    }
+